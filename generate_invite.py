@@ -3,11 +3,15 @@
 Generate a Discord bot invite link with the required permissions.
 """
 
+import base64
 import os
+from urllib.parse import urlencode
+
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, unless the token is already injected
+if not os.getenv("DISCORD_BOT_TOKEN"):
+    load_dotenv()
 
 def generate_invite_link():
     """Generate the bot invite link with required permissions."""
@@ -19,25 +23,29 @@ def generate_invite_link():
         print("   Make sure you have a .env file with your bot token")
         return
     
-    # Extract application ID from token (first part before first dot)
+    # Extract application ID from token (first part before first dot).
+    # Real tokens use the URL-safe base64 alphabet (- and _), so decode
+    # with urlsafe_b64decode; the fixed '==' pad covers any input length.
     try:
-        app_id = token.split('.')[0]
-        # Decode base64 to get the actual application ID
-        import base64
-        app_id = base64.b64decode(app_id + '==').decode('utf-8')
-    except:
+        app_id = base64.urlsafe_b64decode(token.split('.', 1)[0] + '==').decode('ascii')
+    except Exception:
         print("❌ Invalid bot token format")
         return
-    
+
     # Required permissions for SoundScribe:
     # 2048 = Use Slash Commands
     # 3145728 = Connect + Speak (voice)
     # 2048 = Send Messages
     # Total: 3149824
     permissions = 3149824
-    
+
     # Generate invite URL
-    invite_url = f"https://discord.com/api/oauth2/authorize?client_id={app_id}&permissions={permissions}&scope=bot%20applications.commands"
+    query = urlencode({
+        "client_id": app_id,
+        "permissions": permissions,
+        "scope": "bot applications.commands",
+    })
+    invite_url = f"https://discord.com/api/oauth2/authorize?{query}"
     
     print("🔗 SoundScribe Bot Invite Link:")
     print(f"   {invite_url}")
@@ -6,25 +6,39 @@ This can be used for development and testing.
 
 import os
 import logging
+import logging.handlers
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
+# Load environment variables from .env file if it exists. Skip the disk
+# read entirely when the token is already injected (Docker/systemd).
 env_file = Path(__file__).parent / ".env"
-if env_file.exists():
+if not os.getenv("DISCORD_BOT_TOKEN") and env_file.exists():
     load_dotenv(env_file)
 
-# Configure logging
+# Configure logging. The log file is the primary sink; mirroring to the
+# console is opt-in (LOG_CONSOLE=1) so every record isn't formatted and
+# written twice by default.
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+handlers = [
+    logging.handlers.RotatingFileHandler(
+        "soundscribe.log", maxBytes=10 * 1024 * 1024, backupCount=3
+    )
+]
+if os.getenv("LOG_CONSOLE", "0") == "1":
+    handlers.append(logging.StreamHandler())
+
 logging.basicConfig(
     level=getattr(logging, log_level),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("soundscribe.log")
-    ]
+    handlers=handlers
 )
 
+# None of our formats use thread/process fields; skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Import and run the bot
 from src.soundscribe import main
 
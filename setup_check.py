@@ -4,11 +4,14 @@ Setup verification script for SoundScribe.
 Checks all prerequisites and provides setup guidance.
 """
 
+import asyncio
+import io
 import sys
-import subprocess
-import shutil
+import threading
 from pathlib import Path
 
+from src.soundscribe._probe import ffmpeg_capabilities
+
 def check_python_version():
     """Check Python version compatibility."""
     print("🐍 Checking Python version...")
@@ -30,22 +33,14 @@ def check_python_version():
 def check_ffmpeg():
     """Check if FFmpeg is installed."""
     print("\n🎵 Checking FFmpeg...")
-    
-    if shutil.which("ffmpeg"):
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                print(f"✓ {version_line}")
-                return True
-        except subprocess.TimeoutExpired:
-            pass
-    
+
+    caps = ffmpeg_capabilities()
+    if caps["version"]:
+        print(f"✓ {caps['version']}")
+        if not caps["has_libopus"]:
+            print("⚠️  libopus encoder not available in this FFmpeg build")
+        return True
+
     print("❌ FFmpeg not found")
     print("   Install FFmpeg:")
     print("   - Ubuntu/Debian: sudo apt install ffmpeg")
@@ -118,10 +113,40 @@ def check_directories():
     
     return True
 
-def main():
-    """Run all setup checks."""
+class _ThreadOutput:
+    """stdout proxy that routes prints into a per-thread buffer when one is set."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        """Send this thread's writes to the given buffer."""
+        self._local.buffer = buffer
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._fallback).write(text)
+
+    def flush(self):
+        buffer = getattr(self._local, "buffer", None)
+        (buffer or self._fallback).flush()
+
+
+def _run_captured(proxy, check_func):
+    """Run a check in a worker thread, capturing everything it prints."""
+    buffer = io.StringIO()
+    proxy.capture(buffer)
+    try:
+        return check_func(), buffer.getvalue()
+    finally:
+        proxy.capture(None)
+
+
+async def _amain():
+    """Run all setup checks concurrently."""
     print("🔧 SoundScribe Setup Verification\n")
-    
+
     checks = [
         ("Python Version", check_python_version),
         ("FFmpeg", check_ffmpeg),
@@ -129,16 +154,30 @@ def main():
         ("Environment", check_environment),
         ("Directories", check_directories),
     ]
-    
+
+    # The checks are independent (subprocess spawns, imports, file stats),
+    # so run them in worker threads and wait for the slowest one. Output is
+    # buffered per check and replayed in declared order.
+    proxy = _ThreadOutput(sys.stdout)
+    sys.stdout = proxy
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_run_captured, proxy, check_func) for _, check_func in checks),
+            return_exceptions=True
+        )
+    finally:
+        sys.stdout = proxy._fallback
+
     results = []
-    for name, check_func in checks:
-        try:
-            result = check_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ Error checking {name}: {e}")
+    for (name, _), outcome in zip(checks, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ Error checking {name}: {outcome}")
             results.append((name, False))
-    
+        else:
+            result, output = outcome
+            print(output, end="")
+            results.append((name, result))
+
     print("\n" + "="*50)
     print("📋 Setup Summary:")
     
@@ -160,5 +199,9 @@ def main():
             print("   Install Python 3.12 using pyenv or your package manager")
             print("   Then recreate the virtual environment with Python 3.12")
 
+def main():
+    """Run all setup checks."""
+    asyncio.run(_amain())
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,6 @@
 """SoundScribe Discord Bot - Audio recording and mixing for voice channels."""
 
 import asyncio
-import signal
 import sys
 
 
@@ -18,16 +17,17 @@ def main() -> None:
         else:
             raise
     
+    # Create the event loop explicitly so the bot binds to it. Signal
+    # handling is owned by pycord's run(): it installs its own
+    # SIGINT/SIGTERM handlers (replacing any we would register here) that
+    # stop the loop, and its runner awaits bot.close() on the way out, so
+    # voice connections, sink temp files, and the download server are
+    # released cleanly without an early sys.exit cutting that short.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     bot = SoundScribeBot()
-    
-    def signal_handler(signum, frame):
-        print("\nShutting down SoundScribe...")
-        asyncio.create_task(bot.close())
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
+
     try:
         bot.run()
     except KeyboardInterrupt:
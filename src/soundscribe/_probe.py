@@ -0,0 +1,46 @@
+"""Cached probes for external tool availability."""
+
+import functools
+import shutil
+import subprocess
+
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_capabilities() -> dict:
+    """Probe the ffmpeg binary once and cache the result.
+
+    Returns a dict with:
+        path: resolved ffmpeg path, or None if not installed
+        version: first line of ``ffmpeg -version`` output, or None
+        has_libopus: whether the libopus encoder is available
+    """
+    path = shutil.which("ffmpeg")
+    if not path:
+        return {"path": None, "version": None, "has_libopus": False}
+
+    version = None
+    try:
+        result = subprocess.run(
+            [path, "-hide_banner", "-version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            version = result.stdout.split("\n", 1)[0]
+    except (subprocess.TimeoutExpired, OSError):
+        return {"path": path, "version": None, "has_libopus": False}
+
+    # "-h encoder=libopus" exits non-zero when the encoder is missing, so
+    # the exit code alone answers the question — no codec-table parsing.
+    try:
+        opus_probe = subprocess.run(
+            [path, "-hide_banner", "-h", "encoder=libopus"],
+            capture_output=True,
+            timeout=3
+        )
+        has_libopus = opus_probe.returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        has_libopus = False
+
+    return {"path": path, "version": version, "has_libopus": has_libopus}
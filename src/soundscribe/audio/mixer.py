@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 import subprocess
 from typing import List, Tuple
 from pathlib import Path
@@ -14,6 +15,18 @@ class AudioMixer:
     
     def __init__(self):
         self.ffmpeg_path = "ffmpeg"
+
+        # Static argv tail shared by every encode, built once. -threads 0
+        # lets the encoder use all cores; -loglevel error keeps stderr to
+        # actual failures; -f mp3 is needed because output goes to a .part
+        # file whose suffix defeats extension-based muxer detection.
+        self._enc_tail = (
+            "-acodec", "libmp3lame",
+            "-ab", "128k",
+            "-threads", "0",
+            "-loglevel", "error",
+            "-f", "mp3",
+        )
     
     async def mix_audio_files(
         self, 
@@ -31,22 +44,34 @@ class AudioMixer:
         """
         if not audio_files:
             raise ValueError("No audio files to mix")
-        
+
+        # Have ffmpeg write to a .part file and rename into place once it
+        # succeeds, so readers never observe a torn output.
+        part_path = f"{output_path}.part"
+
         if len(audio_files) == 1:
             # Single file - just convert to MP3
-            await self._convert_single_file(audio_files[0][0], output_path)
+            await self._convert_single_file(audio_files[0][0], part_path)
         else:
             # Multiple files - mix them
-            await self._mix_multiple_files(audio_files, output_path, total_duration)
-    
+            await self._mix_multiple_files(audio_files, part_path, total_duration)
+
+        os.replace(part_path, output_path)
+
+    async def encode_wav_to_mp3(self, input_path: str, output_path: str):
+        """Encode a single WAV straight to MP3 with no filter graph."""
+        part_path = f"{output_path}.part"
+        await self._convert_single_file(input_path, part_path)
+        os.replace(part_path, output_path)
+
     async def _convert_single_file(self, input_path: str, output_path: str):
         """Convert a single audio file to MP3."""
         cmd = [
             self.ffmpeg_path,
             "-y",  # Overwrite output file
             "-i", input_path,
-            "-acodec", "libmp3lame",
-            "-ab", "128k",
+            "-compression_level", "7",  # lame -q scale: 0 slowest/best, 9 fastest
+            *self._enc_tail,
             output_path
         ]
         
@@ -60,24 +85,29 @@ class AudioMixer:
         total_duration: float
     ):
         """Mix multiple audio files with proper timing."""
-        # Build FFmpeg command for mixing
-        cmd = [self.ffmpeg_path, "-y"]
-        
-        # Add input files
+        # Input list for the mix
+        inputs = []
         for file_path, _ in audio_files:
-            cmd.extend(["-i", file_path])
-        
-        # Create filter graph for mixing
-        # For now, we'll use a simple amix filter
+            inputs.extend(("-i", file_path))
+
+        # Create filter graph for mixing. Normalizing to 48kHz s16 stereo
+        # inside the graph hands libmp3lame exactly the format it wants, so
+        # ffmpeg doesn't insert an extra resampler between filter and encoder.
         num_inputs = len(audio_files)
-        filter_complex = f"amix=inputs={num_inputs}:duration=longest:dropout_transition=2"
-        
-        cmd.extend([
+        filter_complex = (
+            f"amix=inputs={num_inputs}:duration=longest:dropout_transition=2,"
+            "aresample=48000,aformat=sample_fmts=s16:channel_layouts=stereo"
+        )
+
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            *inputs,
+            "-filter_complex_threads", "0",
             "-filter_complex", filter_complex,
-            "-acodec", "libmp3lame",
-            "-ab", "128k",
+            *self._enc_tail,
             output_path
-        ])
+        ]
         
         await self._run_ffmpeg(cmd)
         logger.info(f"Mixed {num_inputs} files into: {output_path}")
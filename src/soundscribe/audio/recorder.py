@@ -1,6 +1,7 @@
 """Audio recording system with multi-stream capture and processing."""
 
 import os
+import shutil
 import time
 import logging
 import asyncio
@@ -21,11 +22,31 @@ class AudioRecorder:
     def __init__(self, recordings_dir: str = "recordings"):
         self.recordings_dir = Path(recordings_dir)
         self.recordings_dir.mkdir(exist_ok=True)
-        
+        self._sweep_stale_temp_files()
+
         self.is_recording = False
         self.current_session: Optional[RecordingSession] = None
         self.mixer = AudioMixer()
-    
+
+        # Path of the most recently finished recording; avoids re-scanning
+        # the recordings directory on every lookup.
+        self._last_path: Optional[str] = None
+
+    def _sweep_stale_temp_files(self):
+        """Remove sink temp files left behind by a crashed previous run.
+
+        The sink streams per-user audio to ``soundscribe_*`` files in the
+        recordings directory; a clean session moves or deletes them, so any
+        that remain at startup are orphans. No recording can be in flight
+        yet, so deleting them here is safe.
+        """
+        for stale in self.recordings_dir.glob("soundscribe_*"):
+            try:
+                stale.unlink()
+                logger.info(f"Removed stale temp file: {stale}")
+            except OSError as e:
+                logger.warning(f"Could not remove stale temp file {stale}: {e}")
+
     async def start_recording(self, voice_client: discord.VoiceClient, guild_id: int):
         """Start recording in the given voice channel."""
         if self.is_recording:
@@ -34,11 +55,16 @@ class AudioRecorder:
         self.current_session = RecordingSession(guild_id, self.recordings_dir)
         self.is_recording = True
         
-        # Create custom sink for multi-stream recording
-        sink = MultiStreamSink()
+        # Create custom sink for multi-stream recording; temp files go in
+        # the recordings directory so the final move is a same-fs rename
+        sink = MultiStreamSink(temp_dir=str(self.recordings_dir))
         
-        # Start recording
-        voice_client.start_recording(
+        # Start recording. pycord loads the Opus shared library on first
+        # use, which can block for tens of ms, so keep it off the event
+        # loop. Only one recording runs at a time, so the thread hop is
+        # safe.
+        await asyncio.to_thread(
+            voice_client.start_recording,
             sink,
             self._recording_finished_callback,
             self.current_session
@@ -52,12 +78,11 @@ class AudioRecorder:
             return None
         
         self.is_recording = False
-        
+
         # The voice client's stop_recording() will trigger the callback
         # We'll wait for the session to complete processing
-        while not self.current_session.is_complete:
-            await asyncio.sleep(0.1)
-        
+        await self.current_session.done_event.wait()
+
         return self.current_session.final_audio_path
     
     async def handle_voice_state_update(self, member, before, after):
@@ -69,21 +94,45 @@ class AudioRecorder:
     
     def get_latest_recording(self) -> Optional[str]:
         """Get the path to the most recent recording."""
+        if self._last_path:
+            return self._last_path
+
+        # Cold start: fall back to scanning the directory once and memoize.
         if not self.recordings_dir.exists():
             return None
-        
-        mp3_files = list(self.recordings_dir.glob("*.mp3"))
-        if not mp3_files:
+
+        # Single pass with scandir: each DirEntry caches its stat result,
+        # so this costs one syscall per file instead of readdir + stat.
+        # Final outputs are .mp3, or .wav when SOUNDSCRIBE_KEEP_WAV is set.
+        # Skip intermediates that share the directory: flushed per-user WAVs
+        # (_user_) and the sink's in-flight temp files (soundscribe_*, raw
+        # headerless PCM despite the .wav suffix).
+        best = None
+        best_mtime = -1.0
+        with os.scandir(self.recordings_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith((".mp3", ".wav")):
+                    continue
+                if entry.name.startswith("soundscribe_"):
+                    continue
+                if "_user_" in entry.name or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best, best_mtime = entry.path, mtime
+
+        if best is None:
             return None
-        
-        # Sort by modification time, newest first
-        latest = max(mp3_files, key=lambda f: f.stat().st_mtime)
-        return str(latest)
+
+        self._last_path = best
+        return self._last_path
     
     async def _recording_finished_callback(self, sink: MultiStreamSink, session: "RecordingSession"):
         """Called when recording stops."""
         try:
             await session.process_recording(sink, self.mixer)
+            if session.final_audio_path:
+                self._last_path = session.final_audio_path
         except Exception as e:
             logger.error(f"Failed to process recording: {e}")
         finally:
@@ -103,6 +152,7 @@ class RecordingSession:
         # Track users and their audio segments
         self.user_segments: Dict[int, List[Tuple[float, str]]] = {}
         self.is_complete = False
+        self.done_event = asyncio.Event()
         self.final_audio_path: Optional[str] = None
     
     def _generate_session_id(self) -> str:
@@ -123,6 +173,39 @@ class RecordingSession:
             # User left
             logger.debug(f"User {member.display_name} left at {current_time:.2f}s")
     
+    def _flush_user(self, user_id: int, audio) -> Tuple[str, float]:
+        """Move a user's streamed audio file into the recordings directory."""
+        temp_file = self.recordings_dir / f"{self.session_id}_user_{user_id}.wav"
+
+        # The sink already streamed the audio to disk; just move it.
+        audio.cleanup()
+        shutil.move(audio.path, temp_file)
+
+        logger.debug(f"Saved audio for user {user_id}: {temp_file}")
+        return (str(temp_file), 0.0)  # Start at 0.0 for now
+
+    @staticmethod
+    def _remove_temp_files(temp_files: List[Tuple[str, float]]):
+        """Delete the per-user temp files left over after mixing."""
+        for temp_file, _ in temp_files:
+            try:
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+
+    async def _finalize_single(self, wav_path: str, mixer: AudioMixer) -> Path:
+        """Finalize a one-speaker session without the amix filter graph."""
+        if os.getenv("SOUNDSCRIBE_KEEP_WAV") == "1":
+            # Keep the WAV as-is: no ffmpeg process at all.
+            final_path = self.recordings_dir / f"{self.session_id}.wav"
+            await asyncio.to_thread(shutil.move, wav_path, final_path)
+            return final_path
+
+        final_path = self.recordings_dir / f"{self.session_id}.mp3"
+        await mixer.encode_wav_to_mp3(wav_path, str(final_path))
+        await asyncio.to_thread(self._remove_temp_files, [(wav_path, 0.0)])
+        return final_path
+
     async def process_recording(self, sink: MultiStreamSink, mixer: AudioMixer):
         """Process the recorded audio into a final mixed file."""
         try:
@@ -131,38 +214,35 @@ class RecordingSession:
                 self.is_complete = True
                 return
             
-            # Save individual audio files temporarily
-            temp_files = []
+            # Move individual audio files into place, one thread per user so
+            # the event loop isn't blocked and slow disks overlap.
             session_duration = time.time() - self.start_time
-            
-            for user_id, audio in sink.audio_data.items():
-                if audio.file:
-                    temp_file = self.recordings_dir / f"{self.session_id}_user_{user_id}.wav"
-                    
-                    # Save the audio file
-                    audio.file.seek(0)
-                    with open(temp_file, 'wb') as f:
-                        f.write(audio.file.read())
-                    
-                    temp_files.append((str(temp_file), 0.0))  # Start at 0.0 for now
-                    logger.debug(f"Saved audio for user {user_id}: {temp_file}")
+            temp_files = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._flush_user, user_id, audio)
+                    for user_id, audio in sink.audio_data.items()
+                    if audio.path
+                )
+            )
             
             if temp_files:
-                # Mix all audio files
-                final_path = self.recordings_dir / f"{self.session_id}.mp3"
-                await mixer.mix_audio_files(temp_files, str(final_path), session_duration)
-                
-                # Clean up temporary files
-                for temp_file, _ in temp_files:
-                    try:
-                        os.unlink(temp_file)
-                    except FileNotFoundError:
-                        pass
-                
+                if len(temp_files) == 1:
+                    # One speaker - no mixing needed, skip the amix graph
+                    final_path = await self._finalize_single(temp_files[0][0], mixer)
+                else:
+                    # Mix all audio files
+                    final_path = self.recordings_dir / f"{self.session_id}.mp3"
+                    await mixer.mix_audio_files(temp_files, str(final_path), session_duration)
+
+                    # Clean up temporary files in one thread hop so the
+                    # per-file unlink syscalls don't run on the event loop.
+                    await asyncio.to_thread(self._remove_temp_files, temp_files)
+
                 self.final_audio_path = str(final_path)
                 logger.info(f"Recording session complete: {self.final_audio_path}")
             
         except Exception as e:
             logger.error(f"Failed to process recording session: {e}")
         finally:
-            self.is_complete = True
\ No newline at end of file
+            self.is_complete = True
+            self.done_event.set()
\ No newline at end of file
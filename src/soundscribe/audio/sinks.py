@@ -1,56 +1,94 @@
 """Custom audio sinks for multi-stream recording."""
 
-import io
 import logging
-from typing import Dict, Optional
+import tempfile
+from typing import BinaryIO, Dict, Optional
 import discord
 
 logger = logging.getLogger(__name__)
 
 
 class MultiStreamSink(discord.sinks.Sink):
-    """Custom sink that captures audio from multiple users separately."""
-    
-    def __init__(self):
+    """Custom sink that captures audio from multiple users separately.
+
+    Args:
+        temp_dir: Directory for the per-user temp files. Pass the
+            recordings directory so the post-session move is a rename on
+            the same filesystem, not a byte copy out of the system tmp
+            (often tmpfs, which would also keep the audio in RAM).
+    """
+
+    def __init__(self, temp_dir: Optional[str] = None):
         super().__init__()
         self.encoding = "wav"
+        self.temp_dir = temp_dir
         self.audio_data: Dict[int, AudioData] = {}
-    
+
     def wants_opus(self) -> bool:
         """We want decoded audio for processing."""
         return False
-    
+
     def write(self, data, user):
-        """Write audio data from a specific user."""
-        if user not in self.audio_data:
-            self.audio_data[user] = AudioData()
-        
-        self.audio_data[user].write(data)
-    
+        """Write audio data from a specific user.
+
+        Called from pycord's voice receive thread for every audio packet,
+        so keep it to a single dict lookup on the hot path.
+        """
+        audio = self.audio_data.get(user)
+        if audio is None:
+            audio = self.audio_data[user] = AudioData(self.temp_dir)
+
+        audio.write(data)
+
     def cleanup(self):
-        """Clean up resources."""
+        """Flush and close per-user files.
+
+        pycord calls this before the finished callback runs, so the entries
+        stay in ``audio_data`` — the recording session moves the on-disk
+        files into place afterwards.
+        """
         for audio in self.audio_data.values():
             audio.cleanup()
-        self.audio_data.clear()
 
 
 class AudioData:
-    """Stores audio data for a single user."""
-    
-    def __init__(self):
-        self.file = io.BytesIO()
+    """Stores audio data for a single user, streamed to a temporary file."""
+
+    # Buffer size for the backing file; keeps per-user memory bounded
+    # regardless of how long the call runs.
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, temp_dir: Optional[str] = None):
+        self.file: Optional[BinaryIO] = None
+        self.path: Optional[str] = None
+        self.temp_dir = temp_dir
         self._closed = False
-    
+
     def write(self, data: bytes):
-        """Write audio data."""
-        if not self._closed:
-            self.file.write(data)
-    
+        """Write audio data, opening the backing file on first use."""
+        if self._closed:
+            return
+
+        if self.file is None:
+            self.file = tempfile.NamedTemporaryFile(
+                delete=False,
+                dir=self.temp_dir,
+                prefix="soundscribe_",
+                suffix=".wav",
+                buffering=self.BUFFER_SIZE,
+            )
+            self.path = self.file.name
+
+        self.file.write(data)
+
     def close(self):
         """Close the audio data."""
         self._closed = True
-    
+
     def cleanup(self):
-        """Clean up resources."""
-        if hasattr(self.file, 'close'):
-            self.file.close()
\ No newline at end of file
+        """Flush and close the backing file, leaving it on disk for processing."""
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
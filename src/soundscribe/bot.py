@@ -3,7 +3,7 @@
 import os
 import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Optional
 import discord
 from discord.ext import commands
 
@@ -18,9 +18,11 @@ class SoundScribeBot(discord.Bot):
     """Main SoundScribe Discord bot class."""
     
     def __init__(self):
+        # Slash commands don't need message content; requesting it would
+        # make the gateway push (and the library decode) the full text of
+        # every message in every guild for nothing.
         intents = discord.Intents.default()
         intents.voice_states = True
-        intents.message_content = True
         
         super().__init__(
             intents=intents,
@@ -31,9 +33,10 @@ class SoundScribeBot(discord.Bot):
         self.audio_recorder = AudioRecorder()
         self.download_server: Optional[DownloadServer] = None
         
-        # Connection tracking
-        self.voice_connections: Dict[int, discord.VoiceClient] = {}
-        
+        # Voice state listener registration flag; the listener only exists
+        # while a recording is active.
+        self._voice_tracking = False
+
         # Load commands
         self._load_commands()
     
@@ -42,18 +45,44 @@ class SoundScribeBot(discord.Bot):
         from .commands.recording import setup_recording_commands
         setup_recording_commands(self)
     
-    async def on_ready(self):
-        """Called when the bot is ready."""
-        logger.info(f"SoundScribe logged in as {self.user}")
-        
-        # Start download server
+    async def start(self, token: str, *, reconnect: bool = True):
+        """Start the download server, then connect to the gateway.
+
+        on_ready fires again on every gateway reconnect; starting the
+        HTTP server here instead guarantees it comes up exactly once,
+        before commands can arrive, and is never poked by RESUMEs.
+        """
         if not self.download_server:
             self.download_server = DownloadServer()
             await self.download_server.start()
             logger.info("Download server started")
+
+        await super().start(token, reconnect=reconnect)
+
+    async def on_ready(self):
+        """Called when the bot is ready."""
+        logger.info(f"SoundScribe logged in as {self.user}")
     
-    async def on_voice_state_update(self, member, before, after):
-        """Handle voice state changes for recording purposes."""
+    def enable_voice_tracking(self):
+        """Start listening for voice state changes during a recording.
+
+        The bot intentionally defines no on_voice_state_update method, so
+        when nothing is recording the gateway event is dispatched to no
+        one — no coroutine is created for every join/leave/mute across
+        every guild.
+        """
+        if not self._voice_tracking:
+            self.add_listener(self._track_voice_state, "on_voice_state_update")
+            self._voice_tracking = True
+
+    def disable_voice_tracking(self):
+        """Stop listening for voice state changes."""
+        if self._voice_tracking:
+            self.remove_listener(self._track_voice_state, "on_voice_state_update")
+            self._voice_tracking = False
+
+    async def _track_voice_state(self, member, before, after):
+        """Forward voice state changes to the active recording session."""
         if self.audio_recorder.is_recording:
             await self.audio_recorder.handle_voice_state_update(member, before, after)
     
@@ -73,14 +102,18 @@ class SoundScribeBot(discord.Bot):
         # Stop any active recordings
         if self.audio_recorder.is_recording:
             await self.audio_recorder.stop_recording()
+        self.disable_voice_tracking()
         
         # Stop download server
         if self.download_server:
             await self.download_server.stop()
         
-        # Disconnect from voice channels
-        for vc in self.voice_connections.values():
-            if vc.is_connected():
-                await vc.disconnect()
+        # Disconnect from all voice channels concurrently; pycord tracks
+        # these per guild
+        async with asyncio.TaskGroup() as tg:
+            for guild in self.guilds:
+                vc = guild.voice_client
+                if vc and vc.is_connected():
+                    tg.create_task(vc.disconnect())
         
         await super().close()
\ No newline at end of file
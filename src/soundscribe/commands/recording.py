@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import discord
 from discord.ext import commands
 
@@ -39,13 +40,11 @@ def setup_recording_commands(bot):
                     guild_vc = ctx.guild.voice_client
                     if guild_vc:
                         await guild_vc.disconnect(force=True)
-                    if ctx.guild.id in bot.voice_connections:
-                        del bot.voice_connections[ctx.guild.id]
-                    
-                    # Try the most basic connection possible
-                    vc = await voice_channel.connect()
-                    bot.voice_connections[ctx.guild.id] = vc
-                    
+
+                    # Connect with pycord's native handshake timeout; this
+                    # loop owns retries, so library-level reconnects stay off
+                    vc = await voice_channel.connect(timeout=10.0, reconnect=False)
+
                     # Just test if we can stay connected for 2 seconds
                     await asyncio.sleep(2.0)
                     
@@ -65,15 +64,15 @@ def setup_recording_commands(bot):
                         guild_vc = ctx.guild.voice_client
                         if guild_vc:
                             await guild_vc.disconnect(force=True)
-                        
-                        # Clean up our tracking
-                        if ctx.guild.id in bot.voice_connections:
-                            del bot.voice_connections[ctx.guild.id]
                     except Exception as cleanup_error:
                         logger.warning(f"Cleanup failed: {cleanup_error}")
                     
                     if attempt < max_attempts - 1:
-                        await asyncio.sleep(2)  # Wait before retry
+                        # Exponential backoff with jitter so retries from
+                        # multiple instances don't synchronize against the
+                        # same voice region after an outage
+                        delay = min(30, 1.0 * (2 ** attempt)) * (1 + random.random() * 0.5)
+                        await asyncio.sleep(delay)
                         continue
                     else:
                         # All attempts failed
@@ -95,21 +94,22 @@ def setup_recording_commands(bot):
     @bot.slash_command(description="Start recording audio")
     async def start_recording(ctx: discord.ApplicationContext):
         """Start recording in the connected voice channel."""
-        if ctx.guild.id not in bot.voice_connections:
+        vc = ctx.guild.voice_client
+        if not vc:
             await ctx.respond("❌ Not connected to a voice channel! Use /join first.", ephemeral=True)
             return
-        
+
         if bot.audio_recorder.is_recording:
             await ctx.respond("❌ Already recording!", ephemeral=True)
             return
-        
+
         try:
-            vc = bot.voice_connections[ctx.guild.id]
             if not vc.is_connected():
                 await ctx.respond("❌ Voice connection lost. Use /join again.", ephemeral=True)
                 return
             
             await bot.audio_recorder.start_recording(vc, ctx.guild.id)
+            bot.enable_voice_tracking()
             await ctx.respond("🎙️ Recording started!", ephemeral=True)
             logger.info(f"Recording started in guild {ctx.guild.id}")
             
@@ -123,22 +123,22 @@ def setup_recording_commands(bot):
         if not bot.audio_recorder.is_recording:
             await ctx.respond("❌ Not currently recording!", ephemeral=True)
             return
-        
-        if ctx.guild.id not in bot.voice_connections:
+
+        if not ctx.guild.voice_client:
             await ctx.respond("❌ Not recording in this server!", ephemeral=True)
             return
-        
+
         try:
             await ctx.respond("⏹️ Stopping recording and processing audio...", ephemeral=True)
             
             # Stop recording and get the file path
             audio_file_path = await bot.audio_recorder.stop_recording()
+            bot.disable_voice_tracking()
             
             # Disconnect from voice
-            vc = bot.voice_connections.get(ctx.guild.id)
+            vc = ctx.guild.voice_client
             if vc and vc.is_connected():
                 await vc.disconnect()
-            del bot.voice_connections[ctx.guild.id]
             
             if audio_file_path:
                 # Generate download link
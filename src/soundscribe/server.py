@@ -1,14 +1,26 @@
 """FastAPI embedded web server for secure file downloads."""
 
 import asyncio
+import hashlib
 import logging
+import mimetypes
+import os
 import secrets
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Optional
 from pathlib import Path
 import uvicorn
 from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from starlette.requests import Request
+from starlette.routing import Route
+
+try:
+    import uvloop
+except ImportError:  # not installed on Windows
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +31,25 @@ class DownloadServer:
     def __init__(self, host: str = "127.0.0.1", port: int = 8000):
         self.host = host
         self.port = port
-        self.app = FastAPI(title="SoundScribe Download Server")
+        self.app = FastAPI(
+            title="SoundScribe Download Server",
+            default_response_class=ORJSONResponse
+        )
         self.server: Optional[uvicorn.Server] = None
-        self.server_task: Optional[asyncio.Task] = None
-        
-        # Token storage: token -> (file_path, expiry_time)
-        self.download_tokens: Dict[str, tuple[str, float]] = {}
+        self._server_thread: Optional[threading.Thread] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+        # The server runs on its own thread, so the token store is shared
+        # between the bot loop (inserts) and the server loop (lookups)
+        self._tokens_lock = threading.Lock()
+        
+        # Token storage: sha256(token) ->
+        # (file_path, filename, media_type, expiry_time). Keys
+        # are 32-byte digests, so the raw secret is never stored and a
+        # lookup can't leak token bytes through comparison timing. The TTL
+        # is constant, so insertion order equals expiry order and stale
+        # entries can only accumulate at the front.
+        self.download_tokens: "OrderedDict[bytes, tuple[str, str, str, float]]" = OrderedDict()
         
         # Token expiry time (1 hour)
         self.token_expiry = 3600
@@ -34,111 +59,196 @@ class DownloadServer:
     def _setup_routes(self):
         """Set up FastAPI routes."""
         
+        # The root payload is constant — serialize it once and return the
+        # same Response object on every request.
+        root_response = Response(
+            content=b'{"message":"SoundScribe Download Server"}',
+            media_type="application/json"
+        )
+
         @self.app.get("/")
         async def root():
-            return {"message": "SoundScribe Download Server"}
+            return root_response
         
-        @self.app.get("/download/{token}")
-        async def download_file(token: str):
-            """Download a file using a secure token."""
+        async def download_file(request: Request):
+            """Download a file using a secure token.
+
+            Registered as a bare Starlette route so the hottest endpoint
+            skips FastAPI's dependency resolution and response-model
+            pipeline — the token is a single path param and the response
+            is a raw FileResponse.
+            """
+            token = request.path_params["token"]
             current_time = time.time()
-            
-            # Check if token exists
-            if token not in self.download_tokens:
+
+            # Look up by digest so the raw token is never compared directly
+            token_hash = hashlib.sha256(token.encode()).digest()
+            with self._tokens_lock:
+                entry = self.download_tokens.get(token_hash)
+                expired = entry is not None and current_time > entry[-1]
+                if expired:
+                    del self.download_tokens[token_hash]
+
+            if entry is None:
                 raise HTTPException(status_code=404, detail="Invalid or expired download link")
-            
-            file_path, expiry_time = self.download_tokens[token]
-            
-            # Check if token has expired
-            if current_time > expiry_time:
-                del self.download_tokens[token]
+
+            if expired:
                 raise HTTPException(status_code=404, detail="Download link has expired")
-            
-            # Check if file exists
-            if not Path(file_path).exists():
-                del self.download_tokens[token]
+
+            file_path, filename, media_type, _ = entry
+
+            # One stat call covers the existence check and seeds the
+            # response; the filename was resolved at link creation.
+            try:
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                with self._tokens_lock:
+                    self.download_tokens.pop(token_hash, None)
                 raise HTTPException(status_code=404, detail="File not found")
-            
+
             # Return the file
-            filename = Path(file_path).name
             return FileResponse(
                 path=file_path,
                 filename=filename,
-                media_type="audio/mpeg"
+                media_type=media_type,
+                stat_result=stat_result
             )
-        
+
+        self.app.router.routes.append(
+            Route("/download/{token}", download_file, methods=["GET"])
+        )
+
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint."""
-            return {"status": "healthy", "active_tokens": len(self.download_tokens)}
+            # Only the token count varies; format it straight into the
+            # constant payload instead of building and encoding a dict
+            return Response(
+                content=b'{"status":"healthy","active_tokens":%d}'
+                % len(self.download_tokens),
+                media_type="application/json"
+            )
     
     async def start(self):
         """Start the download server."""
-        if self.server_task:
+        if self._server_thread:
             return  # Already running
-        
+
         config = uvicorn.Config(
             app=self.app,
             host=self.host,
             port=self.port,
+            loop="uvloop" if uvloop else "asyncio",
+            http="httptools",  # C parser; lets FileResponse hit os.sendfile
             log_level="warning",  # Reduce uvicorn logging
             access_log=False
         )
         
         self.server = uvicorn.Server(config)
-        self.server_task = asyncio.create_task(self.server.serve())
-        
+
+        # Run uvicorn on a dedicated thread with its own event loop so a
+        # large file download can never starve the Discord gateway
+        # heartbeat on the bot's loop.
+        self._server_thread = threading.Thread(
+            target=self._serve_in_thread,
+            name="soundscribe-download",
+            daemon=True
+        )
+        self._server_thread.start()
+        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+
         # Wait a moment for the server to start
         await asyncio.sleep(0.1)
         logger.info(f"Download server started on http://{self.host}:{self.port}")
-    
+
+    def _serve_in_thread(self):
+        """Run the uvicorn server on its own event loop."""
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.server.serve())
+        finally:
+            loop.close()
+
     async def stop(self):
         """Stop the download server."""
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+
         if self.server:
             self.server.should_exit = True
-            
-        if self.server_task:
-            try:
-                await asyncio.wait_for(self.server_task, timeout=5.0)
-            except asyncio.TimeoutError:
+
+        if self._server_thread:
+            await asyncio.to_thread(self._server_thread.join, 5.0)
+            if self._server_thread.is_alive():
                 logger.warning("Server shutdown timed out")
-                self.server_task.cancel()
-            finally:
-                self.server_task = None
-                self.server = None
-        
+            self._server_thread = None
+            self.server = None
+
         logger.info("Download server stopped")
     
     async def create_download_link(self, file_path: str) -> str:
         """Create a secure download link for a file."""
-        if not Path(file_path).exists():
+        path = Path(file_path)
+        if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        
-        # Generate secure token
-        token = secrets.token_urlsafe(32)
+
+        # Generate secure token; 16 bytes (128-bit entropy) is ample for a
+        # link that expires in an hour, and halves the URL/key length
+        token = secrets.token_urlsafe(16)
         expiry_time = time.time() + self.token_expiry
-        
-        # Store token
-        self.download_tokens[token] = (file_path, expiry_time)
-        
-        # Clean up expired tokens
-        await self._cleanup_expired_tokens()
+
+        # Store only the token's digest, with the filename and media type
+        # resolved up front so the download path never re-derives them;
+        # recordings may be .mp3 or .wav (SOUNDSCRIBE_KEEP_WAV). The
+        # periodic cleanup task evicts stale entries.
+        token_hash = hashlib.sha256(token.encode()).digest()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        with self._tokens_lock:
+            self.download_tokens[token_hash] = (
+                file_path, path.name, media_type, expiry_time
+            )
         
         download_url = f"http://{self.host}:{self.port}/download/{token}"
         logger.debug(f"Created download link: {download_url}")
         
         return download_url
     
-    async def _cleanup_expired_tokens(self):
-        """Remove expired tokens."""
+    async def _periodic_cleanup(self):
+        """Evict expired tokens once a minute, off the request path."""
+        while True:
+            await asyncio.sleep(60)
+            self._evict_front()
+
+    def _evict_front(self):
+        """Pop expired tokens off the front of the insertion-ordered dict.
+
+        Because every token gets the same TTL, only the oldest entries can
+        be stale — this is O(expired) amortized instead of a full scan.
+        """
         current_time = time.time()
-        expired_tokens = [
-            token for token, (_, expiry) in self.download_tokens.items()
-            if current_time > expiry
-        ]
-        
-        for token in expired_tokens:
-            del self.download_tokens[token]
-        
-        if expired_tokens:
-            logger.debug(f"Cleaned up {len(expired_tokens)} expired tokens")
\ No newline at end of file
+
+        with self._tokens_lock:
+            # Count the stale front run first
+            expired = 0
+            for *_, expiry in self.download_tokens.values():
+                if expiry > current_time:
+                    break
+                expired += 1
+
+            if not expired:
+                return
+
+            if expired * 4 > len(self.download_tokens):
+                # A large share is stale: one comprehension rebuild beats
+                # per-entry deletes, which each pay dict shrink/rehash cost
+                self.download_tokens = OrderedDict(
+                    (token, entry) for token, entry in self.download_tokens.items()
+                    if entry[-1] > current_time
+                )
+            else:
+                for _ in range(expired):
+                    self.download_tokens.popitem(last=False)
+
+        logger.debug(f"Cleaned up {expired} expired tokens")
\ No newline at end of file